@@ -1,7 +1,10 @@
 # Standard library imports
-import struct
+import os
+import time
+import functools
 
-from typing import ByteString, Tuple
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait, FIRST_COMPLETED
+from typing import Any, ByteString, Dict, Iterable, Optional, Tuple
 
 # third party imports
 import numpy as np
@@ -23,6 +26,16 @@ class PhantomImage:
     Changed 12.07.2019
     Added the class variable SUPPORTED_FORMATS, which contains a list of strings, where each string is an identfier
     for one of the transfer formats, which are supported.
+
+    Changed 17.10.2026
+    Added the class variable FORMAT_DTYPES. Images decoded from a transfer format now use the narrowest dtype of the
+    format instead of int64.
+    Added the class variables FORMAT_GROUPS, PACKED_FORMATS and THREAD_POOL for decoding large images with multiple
+    threads.
+    Added the class variable BINNING_MODES and the possibility to reduce the resolution of images for previews.
+    Added the class variables for converting images into 8 bit display images using cached lookup tables.
+    Added the class variables FORMAT_BITS and STATISTICS_CHUNK_ROWS for computing exposure statistics directly from
+    the raw bytes.
     """
 
     # 12.07.2019
@@ -35,6 +48,79 @@ class PhantomImage:
         'P12L'
     ]
 
+    # 17.10.2026
+    # This dict assigns the narrowest numpy dtype, which is able to hold all the possible pixel values of a transfer
+    # format, to each of the formats. The arrays of images decoded from a transfer format will use these dtypes.
+    FORMAT_DTYPES = {
+        'P16':      np.uint16,
+        'P16R':     np.uint16,
+        'P8':       np.uint8,
+        'P8R':      np.uint8,
+        'P10':      np.uint16,
+        'P12L':     np.uint16
+    }
+
+    # 17.10.2026
+    # The number of bits, which are used for a single pixel by each of the transfer formats.
+    FORMAT_BITS = {
+        'P16':      16,
+        'P16R':     16,
+        'P8':       8,
+        'P8R':      8,
+        'P10':      10,
+        'P12L':     12
+    }
+
+    # 17.10.2026
+    # The statistics of an image are computed in chunks of this many rows, so that the whole image never has to be
+    # decoded at once.
+    STATISTICS_CHUNK_ROWS = 64
+
+    # 17.10.2026
+    # The packed formats store a fixed number of pixels in a group of bytes. This dict assigns a tuple to each format,
+    # whose first item is the number of bytes of such a group and the second the number of pixels within that group.
+    # A buffer can only be split at the boundaries of these groups to be decoded in parts.
+    FORMAT_GROUPS = {
+        'P16':      (2, 1),
+        'P16R':     (2, 1),
+        'P8':       (1, 1),
+        'P8R':      (1, 1),
+        'P10':      (5, 4),
+        'P12L':     (3, 2)
+    }
+
+    # 17.10.2026
+    # The formats, for which the pixels actually have to be unpacked from the bytes. The other formats can be used as
+    # a view onto the raw bytes directly.
+    PACKED_FORMATS = [
+        'P10',
+        'P12L'
+    ]
+
+    # 17.10.2026
+    # These are the possible modes for reducing the resolution of an image by an integer factor. "sum" and "mean" add
+    # up all the pixels of each square block of pixels, "decimate" only keeps the first pixel of every block.
+    BINNING_MODES = [
+        'sum',
+        'mean',
+        'decimate'
+    ]
+
+    # 17.10.2026
+    # These are the settings for converting images with a high bit depth into 8 bit images for displaying them. The
+    # lookup tables for this conversion are cached, this is the maximum amount of tables, which are kept. The auto
+    # contrast ignores the given fraction of the darkest and the brightest pixels and only looks at every n-th row of
+    # the image to find them.
+    TONE_MAP_CACHE_SIZE = 64
+    AUTO_CONTRAST_CLIP = 0.005
+    AUTO_CONTRAST_ROW_STEP = 4
+
+    # 17.10.2026
+    # The thread pool, which is shared by all the images to decode the raw bytes in multiple parts at the same time.
+    # It is only created, once it is needed for the first time.
+    THREAD_POOL = None
+    THREAD_POOL_SIZE = os.cpu_count() or 1
+
     def __init__(self, array):
         """
         The constructor
@@ -98,18 +184,15 @@ class PhantomImage:
         Changed 18.03.2019
         Switched to using the struct packing to handle the byte strings.
 
+        Changed 17.10.2026
+        The whole array is now converted at once by numpy instead of packing every pixel on its own.
+
         :return:
         """
-        byte_buffer = []
-        with np.nditer(self.array, op_flags=['readwrite'], order='C') as it:
-            for x in it:
-
-                # 18.03.2019
-                # The format "<" tells that it is little endian byte order and "H" is for short, the datatype with
-                # 2 bytes aka 16 bit.
-                pixel_bytes = struct.pack('<H', x)
-                byte_buffer.append(pixel_bytes)
-        return b''.join(byte_buffer)
+        # 17.10.2026
+        # The dtype '<u2' is little endian ("<") unsigned integer with 2 bytes aka 16 bit. "tobytes" will always return
+        # the bytes in C order, which is row by row.
+        return self.array.astype('<u2').tobytes()
 
     def p8(self):
         """
@@ -123,18 +206,12 @@ class PhantomImage:
         Changed 18.03.2019
         Switched to using the struct packing to handle the byte strings.
 
+        Changed 17.10.2026
+        The whole array is now converted at once by numpy instead of packing every pixel on its own.
+
         :return:
         """
-        byte_buffer = []
-        with np.nditer(self.array, op_flags=['readwrite'], order='C') as it:
-            for x in it:
-
-                # 18.03.2019
-                # The format ">" stands for big endian byte order and "B" is for "unsigned char" data type, which has
-                # 1 byte aka 8 bit.
-                pixel_bytes = struct.pack('>B', x)
-                byte_buffer.append(pixel_bytes)
-        return b''.join(byte_buffer)
+        return self.array.astype(np.uint8).tobytes()
 
     def p10(self):
         """
@@ -144,29 +221,30 @@ class PhantomImage:
 
         Added 26.02.2019
 
+        Changed 17.10.2026
+        The whole array is now packed at once using numpy array operations instead of iterating over every pixel.
+
         :return:
         """
-
-        byte_buffer = []
-        with np.nditer(self.array, op_flags=['readwrite'], order='C') as it:
-
-            # Make two bytes out of it and then just delete the first 6
-            index = 0
-            temp = 0
-            for x in it:
-
-                temp += int(x)
-                temp <<= 10
-                index += 1
-
-                if index == 4:
-                    temp >>= 10
-                    bytes_string = temp.to_bytes(5, 'big')
-                    byte_buffer.append(bytes_string)
-                    temp = 0
-                    index = 0
-
-        return b''.join(byte_buffer)
+        # 17.10.2026
+        # 4 pixels with 10 bits each are packed into one group of 5 bytes. Pixels, which do not fill up a complete
+        # group at the end of the image are being dropped.
+        pixels = self.array.reshape(-1)
+        group_count = pixels.size // 4
+        groups = pixels[:group_count * 4].reshape(-1, 4).astype(np.uint64)
+
+        # The first pixel of the group makes up the most significant bits of the 40 bit value.
+        values = (
+            (groups[:, 0] << np.uint64(30)) +
+            (groups[:, 1] << np.uint64(20)) +
+            (groups[:, 2] << np.uint64(10)) +
+            groups[:, 3]
+        )
+
+        # Converting the 64 bit values into big endian byte order, the last 5 bytes of each 8 byte value are the 40
+        # bits, which contain the pixels.
+        group_bytes = values.astype('>u8').view(np.uint8).reshape(-1, 8)[:, 3:]
+        return group_bytes.tobytes()
 
     def p12l(self):
         """
@@ -176,28 +254,139 @@ class PhantomImage:
 
         Added 12.07.2019
 
+        Changed 17.10.2026
+        The whole array is now packed at once using numpy array operations instead of iterating over every pixel.
+
         :return:
         """
         # The P12L format is a 12 Bit transfer format. It is the most practical one, since the bit depth of most of the
         # phantom cameras is 12 Bit. So the transferred data neither looses accuracy (such as with the 10 Bit format)
         # Nor is redundant bits being transmitted (Such as with the 16 Bit format).
         # Since two pixels have 24 Bit, they can be converted into 3 bytes (8x3=24) directly
+        groups = self.array.reshape(-1, 2).astype(np.uint32)
+        values = (groups[:, 0] << np.uint32(12)) | groups[:, 1]
+
+        # Converting the 32 bit values into big endian byte order, the last 3 bytes of each 4 byte value are the 24
+        # bits, which contain the two pixels.
+        group_bytes = values.astype('>u4').view(np.uint8).reshape(-1, 4)[:, 1:]
+        return group_bytes.tobytes()
+
+    # ##################
+    # RESOLUTION METHODS
+    # ##################
+
+    def binned(self, factor, mode='mean'):
+        """
+        Returns a new PhantomImage, whose resolution is reduced by the given integer factor in both directions using
+        the given binning mode. See BINNING_MODES for the possible modes.
+
+        CHANGELOG
+
+        Added 17.10.2026
+
+        :param factor:
+        :param mode:
+        :return:
+        """
+        return PhantomImage(self.bin_array(self.array, factor, mode))
+
+    # ###############
+    # DISPLAY METHODS
+    # ###############
+
+    def tone_mapped(self, bits=None, window=None, level=None, gamma=1.0, auto_contrast=False):
+        """
+        Returns the image as an 8 bit numpy array, which can be used to display the image. The pixel values of the
+        image with the given bit depth are mapped using a precomputed lookup table, which means, that the conversion of
+        a whole image is a single "np.take" call.
+
+        - bits:             The bit depth of the pixel values. On default it is derived from the dtype of the array.
+        - window, level:    Only the pixel values from "level - window / 2" to "level + window / 2" are spread over the
+                            8 bit range. Everything below is black, everything above is white. On default the whole
+                            range of the bit depth is used.
+        - gamma:            The gamma correction to apply to the values within the window.
+        - auto_contrast:    If this is True, window and level are ignored and the window is chosen to contain all
+                            but the darkest and brightest AUTO_CONTRAST_CLIP fraction of the pixels of this image.
 
-        byte_buffer = []
-        with np.nditer(self.array, op_flags=['readwrite'], order='C') as it:
-            while not it.finished:
-                temp = int(it[0])
-                temp <<= 12
-                it.iternext()
-                temp |= int(it[0])
-                it.iternext()
+        CHANGELOG
+
+        Added 17.10.2026
+
+        :param bits:
+        :param window:
+        :param level:
+        :param gamma:
+        :param auto_contrast:
+        :return:
+        """
+        if not np.issubdtype(self.array.dtype, np.integer):
+            raise ValueError('Only images with integer pixel values can be tone mapped, not %s' % self.array.dtype)
+
+        if bits is None:
+            bits = min(self.array.dtype.itemsize * 8, 16)
+
+        if auto_contrast:
+            low, high = self.contrast_limits(bits)
+        elif window is not None or level is not None:
+            window = 2 ** bits if window is None else window
+            level = 2 ** (bits - 1) if level is None else level
+            low, high = int(level - window / 2), int(level + window / 2)
+        else:
+            low, high = 0, 2 ** bits - 1
+
+        table = self.tone_map_table(bits, low, high, float(gamma))
+        # Using the "clip" mode, every pixel value, which is too big for the given bit depth is simply treated as the
+        # biggest possible value.
+        return np.take(table, self.array, mode='clip')
+
+    def contrast_limits(self, bits):
+        """
+        Returns a tuple (low, high) of pixel values, where only AUTO_CONTRAST_CLIP of the pixels of the image are
+        darker than low and the same fraction of pixels is brighter than high. Only every AUTO_CONTRAST_ROW_STEP-th row
+        of the image is used to compute the limits.
+
+        CHANGELOG
+
+        Added 17.10.2026
+
+        :param bits:
+        :return:
+        """
+        rows = self.array[::self.AUTO_CONTRAST_ROW_STEP].reshape(-1)
+        histogram = np.bincount(np.minimum(rows, 2 ** bits - 1), minlength=2 ** bits)
+        cumulative = np.cumsum(histogram)
+
+        clip_count = cumulative[-1] * self.AUTO_CONTRAST_CLIP
+        low = int(np.searchsorted(cumulative, clip_count, side='right'))
+        high = int(np.searchsorted(cumulative, cumulative[-1] - clip_count, side='left'))
+        return low, max(high, low + 1)
+
+    @classmethod
+    @functools.lru_cache(maxsize=TONE_MAP_CACHE_SIZE)
+    def tone_map_table(cls, bits, low, high, gamma):
+        """
+        Returns the lookup table with 2 ** bits entries, which maps every possible pixel value to an 8 bit value. The
+        values from low to high are spread over the 8 bit range with the given gamma correction. The tables are cached
+        for every combination of the parameters, so they are only computed once.
+
+        CHANGELOG
+
+        Added 17.10.2026
 
-                # At this moment two pixels are saved in the temp variable (at max 24 bit integer) those can be
-                # directly converted into 2 bytes.
-                byte_string = temp.to_bytes(3, 'big')
-                byte_buffer.append(byte_string)
+        :param bits:
+        :param low:
+        :param high:
+        :param gamma:
+        :return:
+        """
+        values = np.arange(2 ** bits, dtype=np.float64)
+        normalized = np.clip((values - low) / max(high - low, 1), 0, 1)
+        normalized **= 1 / gamma
 
-        return b''.join(byte_buffer)
+        table = np.round(normalized * 255).astype(np.uint8)
+        # The same table object is returned for every call with the same parameters, so it must not be modified
+        table.flags.writeable = False
+        return table
 
     # #############
     # CLASS METHODS
@@ -220,7 +409,7 @@ class PhantomImage:
         return cls(array)
 
     @classmethod
-    def from_p16(cls, raw_bytes, resolution):
+    def from_p16(cls, raw_bytes, resolution, dtype=None, out=None):
         """
         Given a byte string a resolution tuple of two ints, this method will convert it into a PhantomImage object and
         return that.
@@ -232,25 +421,33 @@ class PhantomImage:
         Changed 18.03.2019
         Switched to using the struct packing to handle the byte strings.
 
+        Changed 17.10.2026
+        The bytes are not unpacked pixel by pixel anymore. Instead the buffer is directly interpreted as an array of
+        little endian 16 bit integers, which does not need any python level loop and does not copy the data.
+        Added the optional "dtype" parameter.
+        Added the optional "out" parameter, which can be a preallocated array to write the pixels into.
+
         :param raw_bytes:
         :param resolution:
+        :param dtype:
+        :param out:
         :return: PhantomImage
         """
-        pixels = []
-        for i in range(0, len(raw_bytes), 2):
-            bytes_16 = raw_bytes[i:i+2]
-
-            # 18.03.2019
-            # The format '<' tells, that it is little endian byte order and "H" is for "short", the datatype with
-            # 2 bytes aka 16 bit.
-            value = struct.unpack('<H', bytes_16)[0]
-            pixels.append(value)
-        array = np.array(pixels)
+        # 17.10.2026
+        # The dtype '<u2' means little endian ("<") unsigned integer with 2 bytes aka 16 bit, which is exactly the
+        # layout of the P16 format. "frombuffer" only creates a view onto the given bytes, so nothing is copied here.
+        array = np.frombuffer(raw_bytes, dtype='<u2')
         array = array.reshape(resolution)
-        return cls(array)
+
+        if out is not None:
+            cls.check_out(out, resolution, 'P16')
+            np.copyto(out, array)
+            return cls(out)
+
+        return cls(cls.cast_array(array, dtype))
 
     @classmethod
-    def from_p8(cls, raw_bytes, resolution):
+    def from_p8(cls, raw_bytes, resolution, dtype=None, out=None):
         """
         Given a byte string a resolution tuple of two ints, this method will convert it into a PhantomImage object and
         return that.
@@ -259,19 +456,29 @@ class PhantomImage:
 
         Added 26.02.2019
 
+        Changed 17.10.2026
+        The buffer is directly interpreted as an array of 8 bit integers instead of building a list of all the pixels.
+        Added the optional "dtype" parameter.
+        Added the optional "out" parameter, which can be a preallocated array to write the pixels into.
+
         :param raw_bytes:
         :param resolution:
+        :param dtype:
+        :param out:
         :return:
         """
-        pixels = []
-        for byte in raw_bytes:
-            pixels.append(byte)
-        array = np.array(pixels)
+        array = np.frombuffer(raw_bytes, dtype=np.uint8)
         array = array.reshape(resolution)
-        return cls(array)
+
+        if out is not None:
+            cls.check_out(out, resolution, 'P8')
+            np.copyto(out, array)
+            return cls(out)
+
+        return cls(cls.cast_array(array, dtype))
 
     @classmethod
-    def from_p10(cls, raw_bytes, resolution):
+    def from_p10(cls, raw_bytes, resolution, dtype=None, out=None):
         """
         Converts the raw bytes in p10 format into PhantomImage object
 
@@ -282,47 +489,29 @@ class PhantomImage:
         Changed 18.03.2019
         Switched to using the struct packing to handle the byte strings.
 
+        Changed 17.10.2026
+        The whole buffer is now unpacked at once using numpy array operations instead of converting every chunk of
+        bytes into a python integer and shifting out the pixels one by one.
+        Added the optional "dtype" parameter.
+        Added the optional "out" parameter, which can be a preallocated array to write the pixels into.
+
         :param raw_bytes:
         :param resolution:
+        :param dtype:
+        :param out:
         :return:
         """
-        mask = 0b1111111111
-        pixels = []
-
-        index = 0
-        while index < len(raw_bytes):
-            _bytes = raw_bytes[index:index+20]
-            bytes_value = int.from_bytes(_bytes, 'big')
-            _temp = []
-            for i in range(16):
-                value = bytes_value & mask
-                _temp.append(value)
-                bytes_value >>= 10
-            pixels += reversed(_temp)
-            index += 20
-
-        """
-        for i in range(0, len(raw_bytes), 4):
-            bits_32 = raw_bytes[i:i+4]
+        if out is None:
+            array = np.empty(resolution, dtype=cls.FORMAT_DTYPES['P10'])
+            cls.unpack_p10(raw_bytes, array)
+            return cls(cls.cast_array(array, dtype))
 
-            # 18.03.2019
-            # The format '>' tells that it is big endian byte order and the 'L' is for the "long" datatype which is
-            # 4 byte aka 32 bit
-            value = struct.unpack('!L', bits_32)[0]
-            value >>= 2
-
-            mask = 0b1111111111
-            for i in range(0, 3, 1):
-                pixel_value = (value >> 10 * i) & mask
-                pixels.append(pixel_value)
-        """
-
-        array = np.array(pixels)
-        array = array.reshape(resolution)
-        return cls(array)
+        cls.check_out(out, resolution, 'P10')
+        cls.unpack_p10(raw_bytes, out)
+        return cls(out)
 
     @classmethod
-    def from_p12l(cls, raw_bytes, resolution):
+    def from_p12l(cls, raw_bytes, resolution, dtype=None, out=None):
         """
         Returns a new PhantomImage object, which has been created from the given raw bytestring of the image data in
         P12L transfer format.
@@ -331,31 +520,40 @@ class PhantomImage:
 
         Added 12.07.2019
 
+        Changed 17.10.2026
+        The whole buffer is now unpacked at once using numpy array operations instead of looping over every group of
+        three bytes.
+        Added the optional "dtype" parameter.
+        Added the optional "out" parameter, which can be a preallocated array to write the pixels into.
+
         :param raw_bytes:
         :param resolution:
+        :param dtype:
+        :param out:
         :return:
         """
-        # This creates a mask with 12 "1"s
-        mask = (1 << 12) - 1
-        pixels = []
-        index = 0
-        while index < len(raw_bytes):
-            _bytes = raw_bytes[index:index+3]
-            _bytes_value = int.from_bytes(_bytes, 'big')
-            _pixels = [
-                ((_bytes_value >> 12) & mask),
-                (_bytes_value & mask)
-            ]
-            pixels += _pixels
-            index += 3
-
-        array = np.array(pixels)
-        array = array.reshape(resolution)
+        if out is None:
+            array = np.empty(resolution, dtype=cls.FORMAT_DTYPES['P12L'])
+            cls.unpack_p12l(raw_bytes, array)
+            return cls(cls.cast_array(array, dtype))
 
-        return cls(array)
+        cls.check_out(out, resolution, 'P12L')
+        cls.unpack_p12l(raw_bytes, out)
+        return cls(out)
 
     @classmethod
-    def from_transfer_format(cls, fmt, raw_bytes, resolution):
+    def from_transfer_format(
+            cls,
+            fmt,
+            raw_bytes,
+            resolution,
+            dtype=None,
+            out=None,
+            workers=1,
+            roi=None,
+            binning=1,
+            binning_mode='mean'
+    ):
         """
         Given the raw bytes string received from the socket and the resolution of the image, this method will create
         a new PhantomImage object from that information using the format identified by the given string format token
@@ -368,20 +566,137 @@ class PhantomImage:
         Changed 12.07.2019
         Added the 'P12L' format
 
+        Changed 17.10.2026
+        Fixed the 'P12L' entry of the dispatch dict, which was calling the method instead of referencing it and thus
+        made every call to this method fail.
+        Added the optional "dtype" parameter. On default the array of the image will have the dtype given for the
+        format in FORMAT_DTYPES, but any other dtype can be requested this way.
+        Added the optional "out" parameter. If a preallocated array (or a view onto a slice of a bigger array) is given,
+        the pixels are written into that array and the image will use it, instead of allocating a new one. In this case
+        the "dtype" parameter is ignored.
+        Added the optional "workers" parameter. If it is bigger than 1, the raw bytes are split into this many stripes,
+        which are decoded at the same time by the shared thread pool.
+        Added the optional "roi" parameter. It can be a tuple (x, y, width, height) for a region of interest within the
+        image. Only the bytes of this region are decoded and the returned image only contains this region. In this
+        case "out" has to have the shape (height, width) and "workers" is ignored.
+        Added the optional "binning" and "binning_mode" parameters. If "binning" is bigger than 1, the resolution of the
+        image is reduced by this factor using the given mode. With the "decimate" mode, only the rows, which are
+        actually kept, are being decoded. In this case "out" has to have the reduced resolution.
+
         :param fmt:
         :param raw_bytes:
         :param resolution:
+        :param dtype:
+        :param out:
+        :param workers:
+        :param roi:
+        :param binning:
+        :param binning_mode:
         :return:
         """
+        # 17.10.2026
+        # For previews it is often enough to have an image with a much smaller resolution.
+        if binning > 1:
+            if binning_mode == 'decimate' and roi is None:
+                array = cls.unpack_decimated(fmt, raw_bytes, resolution, binning)
+            else:
+                array = cls.from_transfer_format(fmt, raw_bytes, resolution, workers=workers, roi=roi).array
+                array = cls.bin_array(array, binning, binning_mode)
+
+            if out is None:
+                return cls(cls.cast_array(array, dtype))
+
+            cls.check_out(out, array.shape, fmt)
+            np.copyto(out, array, casting='unsafe')
+            return cls(out)
+
+        # 17.10.2026
+        # When only a region of the image is needed, there is no reason to decode all the other pixels as well
+        if roi is not None:
+            x, y, width, height = roi
+            if out is None:
+                array = np.empty((height, width), dtype=cls.FORMAT_DTYPES[fmt])
+                cls.unpack_roi(fmt, raw_bytes, resolution, roi, array)
+                return cls(cls.cast_array(array, dtype))
+
+            cls.check_out(out, (height, width), fmt)
+            cls.unpack_roi(fmt, raw_bytes, resolution, roi, out)
+            return cls(out)
+
+        # 17.10.2026
+        # Numpy releases the GIL during the array operations, so the stripes of the image can actually be decoded in
+        # parallel by multiple threads. P8 and P16 images without an output array are only a view onto the raw bytes
+        # though, which is faster than any parallel decoding.
+        if workers > 1 and (fmt in cls.PACKED_FORMATS or out is not None):
+            if out is None:
+                array = np.empty(resolution, dtype=cls.FORMAT_DTYPES[fmt])
+                cls.unpack_parallel(fmt, raw_bytes, array, workers)
+                return cls(cls.cast_array(array, dtype))
+
+            cls.check_out(out, resolution, fmt)
+            cls.unpack_parallel(fmt, raw_bytes, out, workers)
+            return cls(out)
+
         _methods = {
             'P16':          cls.from_p16,
             'P16R':         cls.from_p16,
             'P8':           cls.from_p8,
             'P8R':          cls.from_p8,
             'P10':          cls.from_p10,
-            'P12L':         cls.from_p12l()
+            'P12L':         cls.from_p12l
+        }
+        return _methods[fmt](raw_bytes, resolution, dtype=dtype, out=out)
+
+    @classmethod
+    def transfer_format_statistics(cls, fmt, raw_bytes, resolution, row_step=1, saturation=None):
+        """
+        Computes the exposure statistics of an image directly from its raw bytes in the given transfer format, without
+        ever decoding the whole image at once. Only every "row_step"-th row is used. Returns a dict with the keys:
+        - histogram:        A numpy array with the count of pixels for every possible pixel value of the format
+        - count:            The number of pixels, which have been used
+        - min:              The smallest pixel value
+        - max:              The biggest pixel value
+        - mean:             The mean of all pixel values
+        - saturated:        The number of pixels, which have at least the value "saturation". On default this is the
+                            biggest possible value of the format.
+
+        CHANGELOG
+
+        Added 17.10.2026
+
+        :param fmt:
+        :param raw_bytes:
+        :param resolution:
+        :param row_step:
+        :param saturation:
+        :return:
+        """
+        rows, columns = resolution
+        value_count = 2 ** cls.FORMAT_BITS[fmt]
+        if saturation is None:
+            saturation = value_count - 1
+
+        # The rows are unpacked chunk by chunk into the same buffer and only the histogram of every chunk is kept. All
+        # the other statistics can then be derived from the histogram.
+        histogram = np.zeros(value_count, dtype=np.int64)
+        buffer = np.empty((cls.STATISTICS_CHUNK_ROWS, columns), dtype=cls.FORMAT_DTYPES[fmt])
+        row_indices = np.arange(0, rows, row_step)
+        for start in range(0, len(row_indices), cls.STATISTICS_CHUNK_ROWS):
+            chunk_indices = row_indices[start:start + cls.STATISTICS_CHUNK_ROWS]
+            chunk = buffer[0:len(chunk_indices)]
+            cls.unpack_rows(fmt, raw_bytes, columns, chunk_indices, 0, columns, chunk)
+            histogram += np.bincount(chunk.reshape(-1), minlength=value_count)
+
+        count = int(histogram.sum())
+        values = np.nonzero(histogram)[0]
+        return {
+            'histogram':    histogram,
+            'count':        count,
+            'min':          int(values[0]),
+            'max':          int(values[-1]),
+            'mean':         float(np.dot(histogram, np.arange(value_count)) / count),
+            'saturated':    int(histogram[saturation:].sum())
         }
-        return _methods[fmt](raw_bytes, resolution)
 
     @classmethod
     def random(cls, resolution):
@@ -392,100 +707,1093 @@ class PhantomImage:
 
         Added 18.03.2019
 
+        Changed 17.10.2026
+        The random array is created with the uint8 dtype directly instead of int64.
+
         :param resolution:
         :return:
         """
         # This will create the correct base array, which only contains regular 8 bit pixel values (range 0 to 256)
-        random_array = np.random.randint(0, 256, resolution)
+        random_array = np.random.randint(0, 256, resolution, dtype=np.uint8)
         # Creating a new PhantomImage object from this array and then returning the Image object
         return cls(random_array)
 
-    # ##############
-    # HELPER METHODS
-    # ##############
+    # #################
+    # UNPACKING METHODS
+    # #################
 
     @classmethod
-    def downscale(cls, array, bits=8):
+    def unpack_transfer_format(cls, fmt, raw_bytes, out):
         """
-        This method takes an array, which represents an image and scales all the values down to the range between 0
-        and 128, which is needed to save the image in the common formats such as jpeg etc.
+        Unpacks the given raw bytes in the transfer format identified by the string "fmt" and writes the pixels into the
+        given C contiguous array "out", which has to have exactly as many elements as there are pixels in the raw bytes.
 
-        :param array:
-        :param bits:
+        CHANGELOG
+
+        Added 17.10.2026
+
+        :param fmt:
+        :param raw_bytes:
+        :param out:
         :return:
         """
-        downscaled_array = array
-        downscaled_array /= np.max(array)
-        downscaled_array *= 2**(bits - 1)
-        return downscaled_array
+        _methods = {
+            'P16':          cls.unpack_p16,
+            'P16R':         cls.unpack_p16,
+            'P8':           cls.unpack_p8,
+            'P8R':          cls.unpack_p8,
+            'P10':          cls.unpack_p10,
+            'P12L':         cls.unpack_p12l
+        }
+        _methods[fmt](raw_bytes, out)
 
+    @classmethod
+    def unpack_parallel(cls, fmt, raw_bytes, out, workers):
+        """
+        Splits the given raw bytes in the transfer format "fmt" into "workers" stripes, which are unpacked into the
+        according parts of the C contiguous array "out" at the same time using the shared thread pool.
 
-class PhantomMedia:
-    """
-    This class/object will act as the main point of interaction with the phantom imaging module.
+        CHANGELOG
 
-    CHANGELOG
+        Added 17.10.2026
 
-    Added 20.05.2019
-    """
+        :param fmt:
+        :param raw_bytes:
+        :param out:
+        :param workers:
+        :return:
+        """
+        group_bytes, group_pixels = cls.FORMAT_GROUPS[fmt]
+        group_count = out.size // group_pixels
+
+        # The buffer may only be split at the boundaries of the pixel groups. Using a memoryview here is important,
+        # because slicing a bytes string would create a copy of the data.
+        raw_view = memoryview(raw_bytes).cast('B')
+        pixels = out.reshape(-1)
+        boundaries = np.linspace(0, group_count, workers + 1).astype(int)
+
+        pool = cls.get_thread_pool()
+        futures = []
+        for start, end in zip(boundaries[:-1], boundaries[1:]):
+            future = pool.submit(
+                cls.unpack_transfer_format,
+                fmt,
+                raw_view[start * group_bytes:end * group_bytes],
+                pixels[start * group_pixels:end * group_pixels]
+            )
+            futures.append(future)
+
+        # Calling result will also raise any exception, which might have occurred within one of the threads
+        for future in futures:
+            future.result()
 
-    def __init__(self):
-        pass
+    @classmethod
+    def unpack_roi(cls, fmt, raw_bytes, resolution, roi, out):
+        """
+        Unpacks only the region of interest given by the tuple (x, y, width, height) from the raw bytes of a whole
+        image with the given resolution in the transfer format "fmt" and writes the pixels into the array "out", which
+        has to have the shape (height, width).
 
-    # IMAGE RELATED METHODS
-    # ---------------------
+        CHANGELOG
+
+        Added 17.10.2026
+
+        :param fmt:
+        :param raw_bytes:
+        :param resolution:
+        :param roi:
+        :param out:
+        :return:
+        """
+        x, y, width, height = roi
+        rows, columns = resolution
+        if x < 0 or y < 0 or width <= 0 or height <= 0 or x + width > columns or y + height > rows:
+            raise ValueError('The region %s is not within an image of the resolution %s' % (roi, resolution))
+
+        cls.unpack_rows(fmt, raw_bytes, columns, np.arange(y, y + height), x, width, out)
 
     @classmethod
-    def create_phantom_image(
-            cls,
-            data: ByteString,
-            resolution: Tuple[int, int],
-            transfer_format: str = "P16"
-    ) -> PhantomImage:
+    def unpack_decimated(cls, fmt, raw_bytes, resolution, factor):
         """
-        Creates a new PhantomImage object from the given data using the given identifier string for the used format to
-        correctly interpret the bytes as pixels and the given resolution to correctly set the linebreaks for the pixels
-        to create a valid image
+        Returns the array of the image with the given resolution in the transfer format "fmt", where only every
+        "factor"-th pixel of every "factor"-th row is kept. Only the rows, which are kept, are actually being unpacked.
 
         CHANGELOG
 
-        Added 20.05.2019
+        Added 17.10.2026
 
-        :param data:
+        :param fmt:
+        :param raw_bytes:
         :param resolution:
-        :param transfer_format:
+        :param factor:
         :return:
         """
-        # Here we simply create a new Phantom image object using the "from_transfer_format" class method the class
-        # overs to directly create from raw data.
-        phantom_image = PhantomImage.from_transfer_format(transfer_format, data, resolution)
-        return phantom_image
+        rows, columns = resolution[0] // factor, resolution[1] // factor
+
+        array = np.empty((rows, resolution[1]), dtype=cls.FORMAT_DTYPES[fmt])
+        cls.unpack_rows(fmt, raw_bytes, resolution[1], np.arange(0, rows * factor, factor), 0, resolution[1], array)
+        return array[:, 0:columns * factor:factor]
 
     @classmethod
-    def load_phantom_image(
-            cls,
-            path: str,
-            resolution: Tuple[int, int],
-            transfer_format: str = "P16"
-    ) -> PhantomImage:
+    def unpack_rows(cls, fmt, raw_bytes, columns, row_indices, x, width, out):
         """
-        Creates a new PhantomImage object by reading the file with the given file path and interpreting the contents as
-        a raw bytes string, using the given identifier string for the used format to correctly interpret the bytes as
-        pixels and the given resolution to correctly set the linebreaks for the pixels to create a valid image.
+        Unpacks "width" pixels starting at the column "x" of all the rows given by the array "row_indices" from the raw
+        bytes of an image with "columns" pixels per row in the transfer format "fmt". The pixels are written into the
+        array "out", which has to have the shape (len(row_indices), width).
 
         CHANGELOG
 
-        Added 20.05.2019
+        Added 17.10.2026
 
-        :param path:
-        :param resolution:
-        :param transfer_format:
+        :param fmt:
+        :param raw_bytes:
+        :param columns:
+        :param row_indices:
+        :param x:
+        :param width:
+        :param out:
         :return:
         """
-        # First we will load the binary data from the given path and then we will calls the method to create a new
-        # phantom image on the raw data
-        with open(path, mode="rb") as file:
-            data = file.read()
-            phantom_image = cls.create_phantom_image(data, resolution, transfer_format)
+        group_bytes, group_pixels = cls.FORMAT_GROUPS[fmt]
+        groups = np.frombuffer(raw_bytes, dtype=np.uint8).reshape(-1, group_bytes)
+
+        # For every row, this is the index of the first needed pixel in the whole (flattened) image, the index of the
+        # group, which contains that pixel and the position of the pixel within that group. If the width of the image
+        # is not a multiple of the pixels per group, the position may be different for every row.
+        first_pixels = (row_indices * columns) + x
+        first_groups = first_pixels // group_pixels
+        offsets = first_pixels % group_pixels
+
+        # Every row needs the same amount of groups to cover the needed pixels including the offset. Only these
+        # groups are copied out of the raw bytes and actually unpacked.
+        group_count = -(-(int(offsets.max()) + width) // group_pixels)
+        group_indices = first_groups[:, np.newaxis] + np.arange(group_count)[np.newaxis, :]
+        np.minimum(group_indices, groups.shape[0] - 1, out=group_indices)
+        region_groups = groups[group_indices]
+
+        region_pixels = np.empty((len(row_indices), group_count * group_pixels), dtype=cls.FORMAT_DTYPES[fmt])
+        cls.unpack_transfer_format(fmt, region_groups, region_pixels)
+
+        # Finally the pixels before the offset and after the width have to be removed from every row
+        if np.all(offsets == offsets[0]):
+            np.copyto(out, region_pixels[:, offsets[0]:offsets[0] + width])
+        else:
+            column_indices = offsets[:, np.newaxis] + np.arange(width)[np.newaxis, :]
+            np.copyto(out, np.take_along_axis(region_pixels, column_indices, axis=1))
 
-        return phantom_image
+    @classmethod
+    def get_thread_pool(cls):
+        """
+        Returns the thread pool shared by all images for decoding. The pool is created on the first call.
+
+        CHANGELOG
+
+        Added 17.10.2026
+
+        :return:
+        """
+        if PhantomImage.THREAD_POOL is None:
+            PhantomImage.THREAD_POOL = ThreadPoolExecutor(max_workers=cls.THREAD_POOL_SIZE)
+        return PhantomImage.THREAD_POOL
+
+    @classmethod
+    def unpack_p16(cls, raw_bytes, out):
+        """
+        Writes the pixels of the given raw bytes in P16 format into the given C contiguous array "out".
+
+        CHANGELOG
+
+        Added 17.10.2026
+
+        :param raw_bytes:
+        :param out:
+        :return:
+        """
+        np.copyto(out.reshape(-1), np.frombuffer(raw_bytes, dtype='<u2'))
+
+    @classmethod
+    def unpack_p8(cls, raw_bytes, out):
+        """
+        Writes the pixels of the given raw bytes in P8 format into the given C contiguous array "out".
+
+        CHANGELOG
+
+        Added 17.10.2026
+
+        :param raw_bytes:
+        :param out:
+        :return:
+        """
+        np.copyto(out.reshape(-1), np.frombuffer(raw_bytes, dtype=np.uint8))
+
+    @classmethod
+    def unpack_p10(cls, raw_bytes, out):
+        """
+        Unpacks the given raw bytes in P10 format and writes the pixels into the given C contiguous integer array
+        "out", which has to have exactly as many elements as there are pixels in the raw bytes.
+
+        CHANGELOG
+
+        Added 17.10.2026
+
+        :param raw_bytes:
+        :param out:
+        :return:
+        """
+        # In the P10 format every pixel uses 10 bits, which means that 4 pixels (40 bits) fit exactly into a group of
+        # 5 bytes. The pixels are packed in big endian order, the first pixel of a group being the 10 most significant
+        # bits of the first two bytes:
+        # |  byte 0  |  byte 1  |  byte 2  |  byte 3  |  byte 4  |
+        # |AAAAAAAA  AA|BBBBBB  BBBB|CCCC  CCCCCC|DD  DDDDDDDD|
+        # So by viewing the buffer as an array with one row per 5 byte group, all the pixels in the same position of
+        # their group can be reassembled at once.
+        groups = np.frombuffer(raw_bytes, dtype=np.uint8).reshape(-1, 5)
+        pixels = out.reshape(-1, 4)
+
+        # All the operations are done in place on the output array. The column of the next pixel is being used as the
+        # scratch space for the low bits of the current pixel, before it is overwritten itself. This way no temporary
+        # arrays have to be allocated.
+        np.copyto(pixels[:, 0], groups[:, 0])
+        pixels[:, 0] <<= 2
+        np.right_shift(groups[:, 1], 6, out=pixels[:, 1])
+        pixels[:, 0] |= pixels[:, 1]
+
+        np.bitwise_and(groups[:, 1], 0x3F, out=pixels[:, 1])
+        pixels[:, 1] <<= 4
+        np.right_shift(groups[:, 2], 4, out=pixels[:, 2])
+        pixels[:, 1] |= pixels[:, 2]
+
+        np.bitwise_and(groups[:, 2], 0x0F, out=pixels[:, 2])
+        pixels[:, 2] <<= 6
+        np.right_shift(groups[:, 3], 2, out=pixels[:, 3])
+        pixels[:, 2] |= pixels[:, 3]
+
+        np.bitwise_and(groups[:, 3], 0x03, out=pixels[:, 3])
+        pixels[:, 3] <<= 8
+        pixels[:, 3] |= groups[:, 4]
+
+    @classmethod
+    def unpack_p12l(cls, raw_bytes, out):
+        """
+        Unpacks the given raw bytes in P12L format and writes the pixels into the given C contiguous integer array
+        "out", which has to have exactly as many elements as there are pixels in the raw bytes.
+
+        CHANGELOG
+
+        Added 17.10.2026
+
+        :param raw_bytes:
+        :param out:
+        :return:
+        """
+        # In the P12L format two pixels with 12 bits each are packed into a group of 3 bytes in big endian order:
+        # |  byte 0  |  byte 1  |  byte 2  |
+        # |AAAAAAAA  AAAA|BBBB  BBBBBBBB|
+        # Viewing the buffer as an array with one row per group, both pixels of all groups are reassembled at once.
+        groups = np.frombuffer(raw_bytes, dtype=np.uint8).reshape(-1, 3)
+        pixels = out.reshape(-1, 2)
+
+        # Just like with P10, the column of the second pixel is used as scratch space while assembling the first one
+        np.copyto(pixels[:, 0], groups[:, 0])
+        pixels[:, 0] <<= 4
+        np.right_shift(groups[:, 1], 4, out=pixels[:, 1])
+        pixels[:, 0] |= pixels[:, 1]
+
+        np.bitwise_and(groups[:, 1], 0x0F, out=pixels[:, 1])
+        pixels[:, 1] <<= 8
+        pixels[:, 1] |= groups[:, 2]
+
+    # ##############
+    # HELPER METHODS
+    # ##############
+
+    @classmethod
+    def bin_array(cls, array, factor, mode='mean'):
+        """
+        Reduces the resolution of the given 2D array by the integer factor in both directions and returns the result.
+        Rows and columns, which do not fill up a complete block at the end of the image are dropped. The possible modes
+        are:
+        - sum:          Every pixel is the sum of a block of factor x factor pixels. To avoid overflows, the sum is
+                        accumulated in (at least) 32 bit integers and the result has that dtype as well.
+        - mean:         Every pixel is the mean of a block of factor x factor pixels with the dtype of the array.
+        - decimate:     Only every factor-th pixel of every factor-th row is kept.
+
+        CHANGELOG
+
+        Added 17.10.2026
+
+        :param array:
+        :param factor:
+        :param mode:
+        :return:
+        """
+        if mode not in cls.BINNING_MODES:
+            raise ValueError('The binning mode "%s" is not one of %s' % (mode, cls.BINNING_MODES))
+
+        rows, columns = array.shape[0] // factor, array.shape[1] // factor
+        cropped = array[0:rows * factor, 0:columns * factor]
+
+        if mode == 'decimate':
+            return cropped[::factor, ::factor]
+
+        # Splitting the rows and columns into blocks, so that the pixels of each block can be summed up along two axes
+        blocks = cropped.reshape(rows, factor, columns, factor)
+        accumulate_dtype = np.promote_types(array.dtype, np.uint32)
+        summed = blocks.sum(axis=(1, 3), dtype=accumulate_dtype)
+
+        if mode == 'sum':
+            return summed
+
+        if np.issubdtype(array.dtype, np.integer):
+            summed //= factor * factor
+        else:
+            summed /= factor * factor
+        return summed.astype(array.dtype)
+
+    @classmethod
+    def cast_array(cls, array, dtype=None):
+        """
+        Returns the given array converted to the given dtype. If dtype is None or the array already has that dtype,
+        the array is returned as it is without making a copy.
+
+        CHANGELOG
+
+        Added 17.10.2026
+
+        :param array:
+        :param dtype:
+        :return:
+        """
+        if dtype is None:
+            return array
+        return array.astype(dtype, copy=False)
+
+    @classmethod
+    def check_out(cls, out, resolution, fmt):
+        """
+        Checks if the given array "out" can be used as the output array for decoding an image of the given resolution
+        in the given transfer format. Raises a ValueError if that is not the case.
+
+        CHANGELOG
+
+        Added 17.10.2026
+
+        :param out:
+        :param resolution:
+        :param fmt:
+        :return:
+        """
+        if out.shape != tuple(resolution):
+            raise ValueError('The output array has the shape %s instead of %s' % (out.shape, tuple(resolution)))
+
+        # The unpacking works on a reshaped view of the output array. If the array was not contiguous, the reshape would
+        # create a copy and the pixels would never arrive in the actual output array.
+        if not out.flags['C_CONTIGUOUS']:
+            raise ValueError('The output array has to be C contiguous')
+
+        if not np.can_cast(cls.FORMAT_DTYPES[fmt], out.dtype):
+            raise ValueError('The output array with dtype %s cannot hold %s pixels' % (out.dtype, fmt))
+
+    @classmethod
+    def downscale(cls, array, bits=8):
+        """
+        This method takes an array, which represents an image and scales all the values down to the range between 0
+        and 128, which is needed to save the image in the common formats such as jpeg etc.
+
+        CHANGELOG
+
+        Changed 17.10.2026
+        The array is not modified in place anymore, which failed for all integer arrays. For displaying images the
+        method "tone_mapped" should be preferred.
+
+        :param array:
+        :param bits:
+        :return:
+        """
+        downscaled_array = array / np.max(array)
+        downscaled_array *= 2**(bits - 1)
+        return downscaled_array
+
+
+class LazyPhantomImage(PhantomImage):
+    """
+    This is a PhantomImage, which does not decode the pixels right away. It only keeps the raw bytes as they have been
+    received in the transfer format together with the format and the resolution. The array is only decoded once it is
+    accessed for the first time and then kept for every following access.
+    This means, that images, which are only saved to disk or passed on in their raw form, never have to be decoded.
+
+    CHANGELOG
+
+    Added 17.10.2026
+    """
+
+    def __init__(self, fmt, raw_bytes, resolution, dtype=None, out=None, workers=1):
+        """
+        The constructor
+
+        CHANGELOG
+
+        Added 17.10.2026
+
+        :param fmt:
+        :param raw_bytes:
+        :param resolution:
+        :param dtype:
+        :param out:
+        :param workers:
+        """
+        self.format = fmt
+        self.raw_bytes = raw_bytes
+        self.resolution = tuple(resolution)
+
+        # These are the additional arguments, which are passed to "from_transfer_format" once the image is decoded
+        self.dtype = dtype
+        self.out = out
+        self.workers = workers
+
+        self._array = None
+
+    @property
+    def array(self):
+        """
+        Returns the decoded numpy array of the image. The raw bytes are only decoded on the first access.
+
+        CHANGELOG
+
+        Added 17.10.2026
+
+        :return:
+        """
+        if self._array is None:
+            phantom_image = PhantomImage.from_transfer_format(
+                self.format,
+                self.raw_bytes,
+                self.resolution,
+                dtype=self.dtype,
+                out=self.out,
+                workers=self.workers
+            )
+            self._array = phantom_image.array
+        return self._array
+
+    @property
+    def decoded(self):
+        """
+        Returns whether the raw bytes have already been decoded into the array
+
+        CHANGELOG
+
+        Added 17.10.2026
+
+        :return:
+        """
+        return self._array is not None
+
+    def to_transfer_format(self, fmt):
+        """
+        Returns the byte string of the image in the given transfer format. If the requested format is the one, in which
+        the raw bytes are held, these are returned directly without ever decoding the image.
+
+        CHANGELOG
+
+        Added 17.10.2026
+
+        :param fmt:
+        :return:
+        """
+        if fmt == self.format:
+            return self.raw_bytes
+        return super(LazyPhantomImage, self).to_transfer_format(fmt)
+
+    def statistics(self, row_step=1, saturation=None):
+        """
+        Returns the dict with the exposure statistics of the image, computed directly from the raw bytes. See
+        "PhantomImage.transfer_format_statistics" for the keys of the dict.
+
+        CHANGELOG
+
+        Added 17.10.2026
+
+        :param row_step:
+        :param saturation:
+        :return:
+        """
+        return PhantomImage.transfer_format_statistics(
+            self.format,
+            self.raw_bytes,
+            self.resolution,
+            row_step=row_step,
+            saturation=saturation
+        )
+
+    def binned(self, factor, mode='mean'):
+        """
+        Returns a new PhantomImage, whose resolution is reduced by the given factor using the given binning mode. If
+        the image has not been decoded yet, the binning is done while decoding the raw bytes, without ever decoding the
+        full image.
+
+        CHANGELOG
+
+        Added 17.10.2026
+
+        :param factor:
+        :param mode:
+        :return:
+        """
+        if self.decoded:
+            return super(LazyPhantomImage, self).binned(factor, mode)
+
+        return PhantomImage.from_transfer_format(
+            self.format,
+            self.raw_bytes,
+            self.resolution,
+            dtype=self.dtype,
+            workers=self.workers,
+            binning=factor,
+            binning_mode=mode
+        )
+
+
+class PhantomBurst:
+    """
+    This class wraps a whole burst of images, which have been transferred one after the other, in a single 3D numpy
+    array with the shape (count, rows, columns). Indexing a burst with an integer returns the PhantomImage of that
+    frame, indexing it with a slice returns a new PhantomBurst with only those frames. Both are views onto the array
+    of the burst and do not copy any pixels.
+
+    CHANGELOG
+
+    Added 17.10.2026
+    """
+
+    def __init__(self, array):
+        """
+        The constructor
+
+        CHANGELOG
+
+        Added 17.10.2026
+
+        :param array:
+        """
+        self.array = array
+
+        self.count = array.shape[0]
+        self.resolution = (array.shape[1], array.shape[2])
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return PhantomBurst(self.array[item])
+        return PhantomImage(self.array[item])
+
+    def __iter__(self):
+        for index in range(self.count):
+            yield PhantomImage(self.array[index])
+
+    # #############
+    # CLASS METHODS
+    # #############
+
+    @classmethod
+    def from_transfer_format(cls, fmt, raw_bytes, resolution, dtype=None, out=None, workers=1):
+        """
+        Given the raw bytes string of multiple images, which have been transferred directly after each other, the
+        resolution of a single image and the identifier string for the transfer format, this method will decode all
+        the images at once and return a new PhantomBurst object. The number of images is computed from the length of
+        the raw bytes.
+        If the optional "out" array is given, it has to have the shape (count, rows, columns) and the pixels are decoded
+        into it directly. It can also be a slice of an even bigger array.
+
+        CHANGELOG
+
+        Added 17.10.2026
+
+        :param fmt:
+        :param raw_bytes:
+        :param resolution:
+        :param dtype:
+        :param out:
+        :param workers:
+        :return:
+        """
+        group_bytes, group_pixels = PhantomImage.FORMAT_GROUPS[fmt]
+        frame_pixels = resolution[0] * resolution[1]
+        # The frames have to end on the boundary of a pixel group, otherwise they could not be decoded as one buffer
+        if frame_pixels % group_pixels != 0:
+            raise ValueError('The resolution %s does not fit into whole %s pixel groups' % (resolution, fmt))
+
+        frame_bytes = (frame_pixels // group_pixels) * group_bytes
+        byte_count = memoryview(raw_bytes).nbytes
+        if byte_count % frame_bytes != 0:
+            raise ValueError('The raw bytes do not contain a whole number of %s images' % fmt)
+        count = byte_count // frame_bytes
+        shape = (count, resolution[0], resolution[1])
+
+        if out is None:
+            array = np.empty(shape, dtype=PhantomImage.FORMAT_DTYPES[fmt])
+        else:
+            PhantomImage.check_out(out, shape, fmt)
+            array = out
+
+        # Since all the frames directly follow each other in the buffer and in the array, the whole burst can be
+        # unpacked in the same way as one very large image.
+        if workers > 1:
+            PhantomImage.unpack_parallel(fmt, raw_bytes, array, workers)
+        else:
+            PhantomImage.unpack_transfer_format(fmt, raw_bytes, array)
+
+        if out is None:
+            return cls(PhantomImage.cast_array(array, dtype))
+        return cls(array)
+
+
+class CachedPhantomImage(PhantomImage):
+    """
+    This is a PhantomImage, which keeps the byte strings of the transfer formats, once they have been created. This
+    only makes sense for images, which are sent over and over again, such as the frames of a PhantomFrameGenerator.
+    The array of such an image should not be modified.
+
+    CHANGELOG
+
+    Added 17.10.2026
+    """
+
+    def __init__(self, array):
+        """
+        The constructor
+
+        CHANGELOG
+
+        Added 17.10.2026
+
+        :param array:
+        """
+        super(CachedPhantomImage, self).__init__(array)
+        self.transfer_bytes = {}
+
+    def to_transfer_format(self, fmt):
+        """
+        Returns the byte string of the image in the given transfer format. The conversion is only done for the first
+        call with each format.
+
+        CHANGELOG
+
+        Added 17.10.2026
+
+        :param fmt:
+        :return:
+        """
+        if fmt not in self.transfer_bytes:
+            self.transfer_bytes[fmt] = super(CachedPhantomImage, self).to_transfer_format(fmt)
+        return self.transfer_bytes[fmt]
+
+
+class PhantomFrameGenerator:
+    """
+    This class creates synthetic images to be used for simulating a camera under load. All the images are generated
+    once, when the object is created, and are kept in a pool. Every call to "grab" then returns the next image of the
+    pool, which costs nothing. As the images of the pool also keep their transfer format bytes, a mock sending these
+    images only has to encode each of them once.
+
+    The possible patterns are:
+    - noise:        Random pixel values in the whole range of the bit depth
+    - gradient:     A horizontal gradient over the whole range of the bit depth, which moves to the right
+    - bars:         Vertical black and white bars, which move to the right
+
+    CHANGELOG
+
+    Added 17.10.2026
+    """
+
+    PATTERNS = [
+        'noise',
+        'gradient',
+        'bars'
+    ]
+
+    # The width of a single bar in pixels for the "bars" pattern
+    BAR_WIDTH = 32
+
+    def __init__(self, resolution, bits=8, pool_size=16, pattern='noise', speed=8, seed=None):
+        """
+        The constructor
+
+        CHANGELOG
+
+        Added 17.10.2026
+
+        :param resolution:
+        :param bits:
+        :param pool_size:
+        :param pattern:
+        :param speed:
+        :param seed:
+        """
+        if pattern not in self.PATTERNS:
+            raise ValueError('The pattern "%s" is not one of %s' % (pattern, self.PATTERNS))
+
+        self.resolution = tuple(resolution)
+        self.bits = bits
+        self.pool_size = pool_size
+        self.pattern = pattern
+        # For the moving patterns, this is the amount of pixels the pattern moves from one image to the next
+        self.speed = speed
+        self.random = np.random.RandomState(seed)
+
+        self.dtype = np.uint8 if bits <= 8 else np.uint16
+        self.array = self.create_pool()
+        # The pool is shared by all the images, which are handed out, so nobody is allowed to modify it
+        self.array.flags.writeable = False
+        self.images = [CachedPhantomImage(frame) for frame in self.array]
+
+        self.index = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return self.grab()
+
+    def grab(self) -> CachedPhantomImage:
+        """
+        Returns the next image of the pool. After the last image, the first one is returned again.
+
+        CHANGELOG
+
+        Added 17.10.2026
+
+        :return:
+        """
+        phantom_image = self.images[self.index]
+        self.index = (self.index + 1) % self.pool_size
+        return phantom_image
+
+    def create_pool(self) -> np.ndarray:
+        """
+        Creates the 3D array with all the images of the pool according to the pattern of this object.
+
+        CHANGELOG
+
+        Added 17.10.2026
+
+        :return:
+        """
+        shape = (self.pool_size, ) + self.resolution
+        max_value = 2 ** self.bits - 1
+
+        if self.pattern == 'noise':
+            return self.random.randint(0, max_value + 1, shape).astype(self.dtype)
+
+        columns = np.arange(self.resolution[1])
+        if self.pattern == 'gradient':
+            row = (columns * max_value) // max(self.resolution[1] - 1, 1)
+        else:
+            row = ((columns // self.BAR_WIDTH) % 2) * max_value
+        base = np.broadcast_to(row.astype(self.dtype), self.resolution)
+
+        # The moving pattern is created by rolling the base pattern a bit further for every image of the pool. Instead
+        # of "np.roll", which would create a new array every time, the two parts of the pattern are directly copied
+        # into the pool array.
+        pool = np.empty(shape, dtype=self.dtype)
+        for index in range(self.pool_size):
+            shift = (index * self.speed) % self.resolution[1]
+            pool[index, :, shift:] = base[:, 0:self.resolution[1] - shift]
+            pool[index, :, 0:shift] = base[:, self.resolution[1] - shift:]
+        return pool
+
+
+class PhantomCaptureFile:
+    """
+    This class gives access to a raw capture file, which contains many images in a transfer format directly after each
+    other. The file is not read when it is opened, but mapped into memory. The images are only read from the file,
+    once they are actually accessed by indexing the object with an integer (returns a LazyPhantomImage) or a slice
+    (returns a PhantomBurst).
+
+    CHANGELOG
+
+    Added 17.10.2026
+    """
+
+    def __init__(self, path: str, resolution: Tuple[int, int], transfer_format: str = 'P16'):
+        """
+        The constructor
+
+        CHANGELOG
+
+        Added 17.10.2026
+
+        :param path:
+        :param resolution:
+        :param transfer_format:
+        """
+        self.path = path
+        self.resolution = tuple(resolution)
+        self.format = transfer_format
+
+        # The size of a single image in the file follows from the number of pixels and the size of the pixel groups of
+        # the format. Bytes at the end of the file, which do not make up a whole image are ignored.
+        group_bytes, group_pixels = PhantomImage.FORMAT_GROUPS[transfer_format]
+        self.frame_bytes = (self.resolution[0] * self.resolution[1] // group_pixels) * group_bytes
+        self.count = os.path.getsize(path) // self.frame_bytes
+
+        # A memory map cannot be created for an empty file
+        if self.count > 0:
+            self.data = np.memmap(path, dtype=np.uint8, mode='r', shape=(self.count, self.frame_bytes))
+        else:
+            self.data = np.empty((0, self.frame_bytes), dtype=np.uint8)
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return self.get_burst(item)
+        return self.get_image(item)
+
+    def __iter__(self):
+        for index in range(self.count):
+            yield self.get_image(index)
+
+    def get_image(self, index: int) -> LazyPhantomImage:
+        """
+        Returns the image with the given index as a LazyPhantomImage. Its raw bytes are a view onto the memory map,
+        so only once the image is decoded the according part of the file is actually read.
+
+        CHANGELOG
+
+        Added 17.10.2026
+
+        :param index:
+        :return:
+        """
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError('The capture file only contains %s images' % self.count)
+
+        return LazyPhantomImage(self.format, self.data[index], self.resolution)
+
+    def get_burst(self, item: slice) -> PhantomBurst:
+        """
+        Returns the images within the given slice as a decoded PhantomBurst.
+
+        CHANGELOG
+
+        Added 17.10.2026
+
+        :param item:
+        :return:
+        """
+        indices = range(*item.indices(self.count))
+        # For a continuous range of images, the bytes of all the images follow each other in the file and can be
+        # decoded in one go.
+        if indices.step == 1:
+            return PhantomBurst.from_transfer_format(self.format, self.data[item], self.resolution)
+
+        array = np.empty((len(indices), ) + self.resolution, dtype=PhantomImage.FORMAT_DTYPES[self.format])
+        for position, index in enumerate(indices):
+            PhantomImage.unpack_transfer_format(self.format, self.data[index], array[position])
+        return PhantomBurst(array)
+
+
+class PhantomMedia:
+    """
+    This class/object will act as the main point of interaction with the phantom imaging module.
+
+    CHANGELOG
+
+    Added 20.05.2019
+
+    Changed 17.10.2026
+    Added the method "export_images" for writing whole sequences of images to image files in parallel.
+    Added the method "open_capture_file" for accessing files with many images without reading the whole file.
+    """
+
+    def __init__(self):
+        pass
+
+    # IMAGE RELATED METHODS
+    # ---------------------
+
+    @classmethod
+    def create_phantom_image(
+            cls,
+            data: ByteString,
+            resolution: Tuple[int, int],
+            transfer_format: str = "P16"
+    ) -> PhantomImage:
+        """
+        Creates a new PhantomImage object from the given data using the given identifier string for the used format to
+        correctly interpret the bytes as pixels and the given resolution to correctly set the linebreaks for the pixels
+        to create a valid image
+
+        CHANGELOG
+
+        Added 20.05.2019
+
+        :param data:
+        :param resolution:
+        :param transfer_format:
+        :return:
+        """
+        # Here we simply create a new Phantom image object using the "from_transfer_format" class method the class
+        # overs to directly create from raw data.
+        phantom_image = PhantomImage.from_transfer_format(transfer_format, data, resolution)
+        return phantom_image
+
+    @classmethod
+    def load_phantom_image(
+            cls,
+            path: str,
+            resolution: Tuple[int, int],
+            transfer_format: str = "P16"
+    ) -> PhantomImage:
+        """
+        Creates a new PhantomImage object by reading the file with the given file path and interpreting the contents as
+        a raw bytes string, using the given identifier string for the used format to correctly interpret the bytes as
+        pixels and the given resolution to correctly set the linebreaks for the pixels to create a valid image.
+
+        CHANGELOG
+
+        Added 20.05.2019
+
+        :param path:
+        :param resolution:
+        :param transfer_format:
+        :return:
+        """
+        # First we will load the binary data from the given path and then we will calls the method to create a new
+        # phantom image on the raw data
+        with open(path, mode="rb") as file:
+            data = file.read()
+            phantom_image = cls.create_phantom_image(data, resolution, transfer_format)
+
+        return phantom_image
+
+    @classmethod
+    def open_capture_file(
+            cls,
+            path: str,
+            resolution: Tuple[int, int],
+            transfer_format: str = "P16"
+    ) -> PhantomCaptureFile:
+        """
+        Opens the raw capture file with the given path, which contains any number of images with the given resolution
+        in the given transfer format directly after each other. The file is mapped into memory, so opening even very
+        large files does not take any time. The returned PhantomCaptureFile object can be indexed to access the images.
+
+        CHANGELOG
+
+        Added 17.10.2026
+
+        :param path:
+        :param resolution:
+        :param transfer_format:
+        :return:
+        """
+        return PhantomCaptureFile(path, resolution, transfer_format)
+
+    # EXPORT RELATED METHODS
+    # ----------------------
+
+    # 17.10.2026
+    # The default template for the file names of exported images. The index of the image within the exported sequence
+    # is inserted, so that the files are sorted in the same order as the images. The file extension decides the file
+    # format (for example ".png" or ".tiff").
+    EXPORT_NAME_TEMPLATE = 'frame_{index:06d}.png'
+
+    @classmethod
+    def export_images(
+            cls,
+            images: Iterable[PhantomImage],
+            folder: str,
+            name_template: str = EXPORT_NAME_TEMPLATE,
+            workers: int = PhantomImage.THREAD_POOL_SIZE,
+            processes: bool = False,
+            max_pending: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Writes all the given images (which may also be a PhantomBurst) into image files within the given folder. The
+        file names are created from the given template, using the index of each image. Encoding and writing of the
+        files is done by a pool of "workers" threads or processes, if "processes" is True.
+        At most "max_pending" images (on default twice the number of workers) are handed to the pool at the same time,
+        so that the memory usage stays bounded even for very long sequences of images.
+        Returns a dict with the keys "count" for the number of written images, "seconds" for the duration of the whole
+        export and "fps" for the achieved number of images per second.
+
+        CHANGELOG
+
+        Added 17.10.2026
+
+        :param images:
+        :param folder:
+        :param name_template:
+        :param workers:
+        :param processes:
+        :param max_pending:
+        :return:
+        """
+        if max_pending is None:
+            max_pending = 2 * workers
+
+        os.makedirs(folder, exist_ok=True)
+        executor_class = ProcessPoolExecutor if processes else ThreadPoolExecutor
+
+        start_time = time.time()
+        count = 0
+        pending = set()
+        with executor_class(max_workers=workers) as executor:
+            for index, phantom_image in enumerate(images):
+                # Once the maximum amount of images is pending, we have to wait for at least one of them to be written
+                # before the next one can be handed to the pool.
+                if len(pending) >= max_pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    count += cls.check_futures(done)
+
+                path = os.path.join(folder, name_template.format(index=index))
+                pending.add(executor.submit(cls.write_image, path, phantom_image.array))
+
+            done, pending = wait(pending)
+            count += cls.check_futures(done)
+
+        seconds = time.time() - start_time
+        return {
+            'count':        count,
+            'seconds':      seconds,
+            'fps':          count / seconds if seconds > 0 else float('inf')
+        }
+
+    @classmethod
+    def write_image(cls, path: str, array: np.ndarray):
+        """
+        Writes the given array as an image file to the given path. The file format is derived from the file extension.
+
+        CHANGELOG
+
+        Added 17.10.2026
+
+        :param path:
+        :param array:
+        :return:
+        """
+        imageio.imwrite(path, array)
+
+    @classmethod
+    def check_futures(cls, futures) -> int:
+        """
+        Given a collection of finished futures, this method will raise the exception of any of them, that has failed
+        and return the number of futures otherwise.
+
+        CHANGELOG
+
+        Added 17.10.2026
+
+        :param futures:
+        :return:
+        """
+        for future in futures:
+            future.result()
+        return len(futures)
@@ -19,7 +19,7 @@ from typing import Any, ByteString, Dict, Tuple
 # package imports
 from phantomcli.phantom import PhantomCamera
 
-from phantomcli.image import PhantomImage
+from phantomcli.image import PhantomImage, LazyPhantomImage, PhantomBurst
 
 from phantomcli.command import parse_parameters
 from phantomcli.command import ImgFormatsMap
@@ -115,6 +115,11 @@ class PhantomSocket:
         'P12L':             1.5
     }
 
+    # 17.10.2026
+    # The 10G connection only supports the packed transfer formats. If any other format is requested for a x-network
+    # connection, the P10 format is being used instead.
+    X_IMG_FORMATS = ['P10', 'P12L']
+
     def __init__(
             self,
             ip,
@@ -124,7 +129,8 @@ class PhantomSocket:
             data_interface='enp1s0',
             img_format='P16',
             camera_class=PhantomCamera,
-            network_type='e'
+            network_type='e',
+            lazy=False
     ):
         """
         Constructor.
@@ -146,6 +152,10 @@ class PhantomSocket:
         Added the parameter and attribute "img_format" for saving the string token name of the transfer format to be
         used.
 
+        Changed 17.10.2026
+        Added the parameter and attribute "lazy". If it is True, the received images are not decoded right away, but
+        returned as LazyPhantomImage objects, which only decode the raw bytes, once their array is accessed.
+
         :param ip:
         """
         # Creating the logger, whose name combines the module, in which this class is based as well as the name of the
@@ -188,9 +198,15 @@ class PhantomSocket:
         # 28.02.2019
         # Will save the image format to be used for the
         self.img_format = img_format
-        if self.network_type == 'x':
+        # 17.10.2026
+        # Previously the x-network always used P10. Now the 12 bit P12L format can be requested as well.
+        if self.network_type == 'x' and self.img_format not in self.X_IMG_FORMATS:
             self.img_format = 'P10'
 
+        # 17.10.2026
+        # Whether the images are supposed to be decoded only on the first access of their array
+        self.lazy = lazy
+
     # ####################################
     # INITIALIZATION/CONFIGURATION METHODS
     # ####################################
@@ -198,7 +214,7 @@ class PhantomSocket:
     # IMAGE ACQUISITION OPERATION ON PHANTOM
     # --------------------------------------
 
-    def img(self):
+    def img(self, out=None):
         """
         This method will send a "img" command to the phantom, which will cause it to take a picture and then send it
         over a newly established data connection to the data server associated with this object.
@@ -218,6 +234,10 @@ class PhantomSocket:
         Removed the call to startdata from this method, as this has to be done on a user level, because it should not
         be used when handling a x-network connection.
 
+        Changed 17.10.2026
+        Added the optional "out" parameter, which is passed on to "receive_image".
+
+        :param out:
         :return:
         """
         # We need to assume, that the data server has been started before calling this method, which is th case if the
@@ -239,11 +259,39 @@ class PhantomSocket:
 
         # 19.03.2019
         # Moved the whole process of communicating and creating the image wrapper object to a separate method
-        phantom_image = self.receive_image(resolution)
+        phantom_image = self.receive_image(resolution, out=out)
 
         return phantom_image
 
-    def receive_image(self, resolution):
+    def img_burst(self, count, out=None):
+        """
+        This method will send a "img" command to the phantom, which requests "count" images at once. All the images are
+        received over the data connection and then decoded in one go into a PhantomBurst object, which is returned.
+
+        CHANGELOG
+
+        Added 17.10.2026
+
+        :param count:
+        :param out:
+        :return:
+        """
+        assert self.data_server is not None
+
+        self.send_img_request(count)
+
+        response = self.receive_image_response()
+        self.logger.debug('The response dict: %s', response)
+        resolution = (response['res'][1], response['res'][0])
+
+        # All the images are transferred directly after each other, so the data server simply has to receive "count"
+        # times the bytes of a single image.
+        image_bytes = self.receive_image_bytes(resolution, count=count)
+        phantom_burst = PhantomBurst.from_transfer_format(self.img_format, image_bytes, resolution, out=out)
+
+        return phantom_burst
+
+    def receive_image(self, resolution, out=None):
         """
         Given the resolution of the image to be received, this method will handle the actual interaction with the data
         server object needed and the creation of the PhantomImage wrapper object from the raw byte string.
@@ -252,7 +300,11 @@ class PhantomSocket:
 
         Added 19.03.2019
 
+        Changed 17.10.2026
+        Added the optional "out" parameter, which is passed on to "create_image".
+
         :param resolution:
+        :param out:
         :return:
         """
         resolution = (resolution[1], resolution[0])
@@ -262,11 +314,11 @@ class PhantomSocket:
 
         # This creates a PhantomImage wrapper object from the raw bytes string. Obviously it also needs the resolution
         # for that to be able to know, where to make the "line breaks"
-        phantom_image = self.create_image(image_bytes, resolution)
+        phantom_image = self.create_image(image_bytes, resolution, out=out)
 
         return phantom_image
 
-    def receive_image_bytes(self, resolution):
+    def receive_image_bytes(self, resolution, count=1):
         """
         Given the resolution of the image, that is being sent, this method will calculate the according amount of bytes
         to be received, pass them to the data server and then receive the raw bytes string, representing the image
@@ -276,12 +328,16 @@ class PhantomSocket:
 
         Added 19.03.2019
 
+        Changed 17.10.2026
+        Added the optional "count" parameter for receiving the bytes of multiple images at once.
+
         :param resolution:
+        :param count:
         :return:
         """
         # 28.02.2019
         # The actual value of the "img_format" property is being used now, that all the formats are implemented
-        self.data_server.size = self.image_byte_size(resolution, image_format=self.img_format)
+        self.data_server.size = self.image_byte_size(resolution, image_format=self.img_format) * count
 
         # This call to "receive_image" will be blocking until the server has received every single byte of the image.
         # From the raw byte string we can reconstruct the image with the additional info about the resolution (when to
@@ -290,7 +346,7 @@ class PhantomSocket:
 
         return image_bytes
 
-    def create_image(self, image_bytes, resolution):
+    def create_image(self, image_bytes, resolution, out=None):
         """
         Given the raw image data byte string and the resolution, together with the knowledge about the used transfer
         format in the attribute "img_format", this method will create a PhantomImage wrapper object for the image
@@ -300,8 +356,16 @@ class PhantomSocket:
 
         Added 19.03.2019
 
+        Changed 17.10.2026
+        Added the optional "out" parameter. It can be a preallocated numpy array of the resolution of the image (or a
+        slice of a bigger array, for example one frame of a 3D array for a whole burst of images), into which the pixels
+        are decoded. This way no new array has to be allocated for every image.
+        If the "lazy" attribute is set, a LazyPhantomImage is returned, which only decodes the bytes, once the array
+        is accessed.
+
         :param image_bytes:
         :param resolution:
+        :param out:
         :return:
         """
         # 28.02.2019
@@ -313,7 +377,10 @@ class PhantomSocket:
             self.img_format,
             resolution
         )
-        phantom_image = PhantomImage.from_transfer_format(self.img_format, image_bytes, resolution)
+        if self.lazy:
+            return LazyPhantomImage(self.img_format, image_bytes, resolution, out=out)
+
+        phantom_image = PhantomImage.from_transfer_format(self.img_format, image_bytes, resolution, out=out)
 
         return phantom_image
 
@@ -1247,6 +1314,9 @@ class PhantomMockControlInterface(socketserver.BaseRequestHandler):
 
         Added 23.02.2019
 
+        Changed 17.10.2026
+        Sending as many images as specified by the "cnt" parameter of the request.
+
         :param data:
         :return:
         """
@@ -1267,7 +1337,10 @@ class PhantomMockControlInterface(socketserver.BaseRequestHandler):
 
         # Here we send the actual image as bytes over the data socket connection
         self.server.logger.debug('Sending image now')
-        self.send_image(phantom_image, parameters['fmt'])
+        # 17.10.2026
+        # Sending as many images as specified by the command request
+        for i in range(value_or_default(parameters, 'cnt', 1)):
+            self.send_image(phantom_image, parameters['fmt'])
         self.server.logger.debug('finished sending image')
 
     def handle_startdata(self, data):
@@ -1812,7 +1885,9 @@ class PhantomMockServer(socketserver.ThreadingTCPServer):
     # The other grab function generates a random noise image and returns that.
     IMAGE_POLICIES = defaultdict(lambda: getattr(PhantomCamera, 'grab_sample'), **{
         'sample':   getattr(PhantomCamera, 'grab_sample'),
-        'random':   getattr(PhantomCamera, 'grab_random')
+        'random':   getattr(PhantomCamera, 'grab_random'),
+        'pool':     getattr(PhantomCamera, 'grab_pool'),
+        'pattern':  getattr(PhantomCamera, 'grab_pattern')
     })
 
     # THE CONSTRUCTOR
@@ -1848,6 +1923,11 @@ class PhantomMockServer(socketserver.ThreadingTCPServer):
         parameters of a request, received by the mock server. This can for example be used to expose these values
         to a testing environment.
 
+        Changed 17.10.2026
+        Added the image policies "pool", which returns random images from a pre generated pool and "pattern", which
+        returns a moving pattern of bars. Both do not create new images for each request and can thus be used to
+        simulate high frame rates.
+
         :param class camera_class:
         """
         # Creating a new logger, whose name is a combination from the module name and the class name of this very class
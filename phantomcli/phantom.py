@@ -4,7 +4,7 @@ import os
 # third party imports
 
 # package imports
-from phantomcli.image import PhantomImage
+from phantomcli.image import PhantomImage, CachedPhantomImage, PhantomFrameGenerator
 
 
 FOLDER_PATH = os.path.dirname(os.path.abspath(__file__))
@@ -221,6 +221,17 @@ class PhantomCamera:
 
     SAMPLE_IMAGE_PATH = os.path.join(FOLDER_PATH, 'sample.jpg')
 
+    # 17.10.2026
+    # The sample image is only loaded from the disk once and then shared by all camera objects
+    SAMPLE_IMAGE = None
+
+    # 17.10.2026
+    # The settings for the synthetic images of the "grab_pool" and "grab_pattern" methods. The bit depth should not be
+    # more than 8, if the images are supposed to be sent in the P8 transfer format.
+    SYNTHETIC_BITS = 8
+    SYNTHETIC_POOL_SIZE = 16
+    SYNTHETIC_SEED = 0
+
     # NETWORK RELATED ADDITIONAL FIELD
     # --------------------------------
 
@@ -253,6 +264,11 @@ class PhantomCamera:
         # 20.05.2019
         self.port = control_port
 
+        # 17.10.2026
+        # The frame generators for the synthetic images, one for each pattern. They are only created, when the
+        # according pattern is first used.
+        self.frame_generators = {}
+
     # #################
     # CAMERA OPERATIONS
     # #################
@@ -303,17 +319,74 @@ class PhantomCamera:
 
         Added 23.02.2019
 
+        Changed 17.10.2026
+        The JPEG image is only loaded and decoded for the very first call, after that the same image object is
+        returned. It also keeps its transfer format bytes, so it does not have to be converted for every request.
+
         :return: PhantomImage
         """
         # Loading a new PhantomImage from the given sample JPEG image
-        phantom_image = PhantomImage.from_jpeg(self.SAMPLE_IMAGE_PATH)
-        return phantom_image
+        if PhantomCamera.SAMPLE_IMAGE is None:
+            phantom_image = PhantomImage.from_jpeg(self.SAMPLE_IMAGE_PATH)
+            phantom_image.array.flags.writeable = False
+            PhantomCamera.SAMPLE_IMAGE = CachedPhantomImage(phantom_image.array)
+        return PhantomCamera.SAMPLE_IMAGE
 
     def grab_random(self):
         resolution = self.get_resolution()
         phantom_image = PhantomImage.random(resolution)
         return phantom_image
 
+    def grab_pool(self):
+        """
+        Returns the next image of a pool of random noise images with the resolution of the camera. Other than
+        "grab_random" this does not create a new image for every call and is thus suited for a high frame rate.
+
+        CHANGELOG
+
+        Added 17.10.2026
+
+        :return: PhantomImage
+        """
+        return self.get_frame_generator('noise').grab()
+
+    def grab_pattern(self):
+        """
+        Returns the next image of a pattern of vertical bars, which moves a little further with every image.
+
+        CHANGELOG
+
+        Added 17.10.2026
+
+        :return: PhantomImage
+        """
+        return self.get_frame_generator('bars').grab()
+
+    def get_frame_generator(self, pattern):
+        """
+        Returns the PhantomFrameGenerator for the given pattern. A new generator is created, if the resolution of the
+        camera has been changed since the last call.
+
+        CHANGELOG
+
+        Added 17.10.2026
+
+        :param pattern:
+        :return: PhantomFrameGenerator
+        """
+        resolution = self.get_resolution()
+        frame_generator = self.frame_generators.get(pattern)
+        if frame_generator is None or frame_generator.resolution != resolution:
+            frame_generator = PhantomFrameGenerator(
+                resolution,
+                bits=self.SYNTHETIC_BITS,
+                pool_size=self.SYNTHETIC_POOL_SIZE,
+                pattern=pattern,
+                seed=self.SYNTHETIC_SEED
+            )
+            self.frame_generators[pattern] = frame_generator
+        return frame_generator
+
     def get_resolution(self):
         """
         Returns the resolution of the camera as a tuple (x, y) specifically
@@ -10,7 +10,7 @@ import matplotlib.pyplot as plt
 # package imports
 from phantomcli.network import PhantomSocket
 from phantomcli.scripts.util import logging_config, logging_format, formats
-from phantomcli.scripts.util import log_help, format_help, xnetwork_help
+from phantomcli.scripts.util import log_help, format_help, xnetwork_help, binning_help
 
 
 @click.command('phget')
@@ -18,9 +18,10 @@ from phantomcli.scripts.util import log_help, format_help, xnetwork_help
 @click.option('--format', '-f', default='P16', help=format_help)
 @click.option('--dataport', '-p', default=60000)
 @click.option('--dataip', '-i', default='127.0.0.1')
+@click.option('--binning', '-b', default=1, help=binning_help)
 @click.option('--log', '-l', default='ERROR', help=log_help)
 @click.argument('ip')
-def command(ip, log, dataip, dataport, format, xnetwork):
+def command(ip, log, dataip, dataport, format, xnetwork, binning):
     """
     Given the IP ADDRESS of the camera, this will open a secondary channel to the camera to receive the raw data of
     the current frame. Once the data has been transmitted completely a new window will open, displaying the image from
@@ -42,7 +43,8 @@ def command(ip, log, dataip, dataport, format, xnetwork):
         img_format=formats[format],
         data_ip=dataip,
         data_port=dataport,
-        network_type=network
+        network_type=network,
+        lazy=(binning > 1)
     )
     phantom_socket.connect()
     click.echo('CONNECTED TO THE PHANTOM CAMERA')
@@ -57,6 +59,12 @@ def command(ip, log, dataip, dataport, format, xnetwork):
     phantom_image = phantom_socket.img()
     click.echo('RECEIVED IMAGE FROM PHANTOM')
 
+    # 17.10.2026
+    # For a preview a smaller image is often enough. Since the socket returns a lazy image in this case, the binning
+    # is done right when the raw bytes are decoded and the full resolution image is never kept around.
+    if binning > 1:
+        phantom_image = phantom_image.binned(binning)
+
     plt.imshow(phantom_image.array, cmap='gray')
     click.echo(phantom_image.array)
     plt.show()
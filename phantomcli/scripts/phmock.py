@@ -10,12 +10,14 @@ import click
 # package imports
 from phantomcli.network import PhantomMockServer
 from phantomcli.scripts.util import logging_format, logging_config
-from phantomcli.scripts.util import log_help
+from phantomcli.scripts.util import log_help, policy_help
 
 
 @click.command('connection')
 @click.option('--log', '-l', default='ERROR', help=log_help)
-def command(log):
+@click.option('--policy', '-p', default='sample', type=click.Choice(['sample', 'random', 'pool', 'pattern']),
+              help=policy_help)
+def command(log, policy):
     """
     Starts a socket server listening at the local IP "127.0.0.1" and on port "7115". The socket server emulate a
     phantom camera and will respond to most commands like a camera would.
@@ -26,7 +28,7 @@ def command(log):
     logging.basicConfig(format=logging_format, level=logging_config[log])
 
     # Simply starting a mock server here and waiting for any requests to come in
-    mock_server = PhantomMockServer(image_policy='sample')
+    mock_server = PhantomMockServer(image_policy=policy)
     mock_server.start()
     click.echo('MOCK SERVER STARTED!')
 
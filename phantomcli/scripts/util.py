@@ -36,6 +36,7 @@ _formats = {
     'P16':      'P16',
     'P16R':     'P16R',
     'P10':      'P10',
+    'P12L':     'P12L',
     'P8':       'P8',
     '8':        'P8',
     'P8R':      'P8R',
@@ -68,11 +69,18 @@ _modes = {
 # copy pasting them for each of them...
 
 format_help = "The transfer format to be used, when transmitting image data. " \
-              "The possible options are 'P10', 'P16' and 'P8'. Default is 'P16' with 16 bit per pixel"
+              "The possible options are 'P10', 'P12L', 'P16' and 'P8'. Default is 'P16' with 16 bit per pixel"
 
 log_help = "The level of logging to be displayed in the console output. The options are 'ERROR' for only displaying " \
            "error messages, 'INFO' for log messages marking important steps in the program execution or 'DEBUG' " \
            "for displaying all log messages. Default is 'ERROR'"
 
+binning_help = "The factor by which the resolution of the displayed image is reduced in both directions. The mean of " \
+               "every block of pixels is displayed. Default is 1, which displays the full image"
+
+policy_help = "The kind of images, the mock server sends. 'sample' sends the same sample image over and over, 'random' " \
+              "creates a new random image for each request, 'pool' cycles through pre generated random images and " \
+              "'pattern' sends a moving pattern of bars. Default is 'sample'"
+
 xnetwork_help = "Setting this flag will enable the transmission using the 10G interface. Make sure, that you are " \
                 "indeed connected using the 10G ethernet interface before setting this flag."
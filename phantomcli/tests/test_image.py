@@ -1,5 +1,6 @@
 # Standard library import
 import os
+import tempfile
 
 from unittest import TestCase
 
@@ -8,7 +9,7 @@ import imageio
 import numpy as np
 
 # Package import
-from phantomcli.image import PhantomImage
+from phantomcli.image import PhantomImage, LazyPhantomImage, PhantomBurst, PhantomMedia, PhantomFrameGenerator
 
 
 class TestPhantomImage(TestCase):
@@ -74,3 +75,212 @@ class TestPhantomImage(TestCase):
         phantom_image = PhantomImage.from_jpeg(self.IMAGE_PATH)
         phantom_image = PhantomImage.from_p12l(phantom_image.p12l(), phantom_image.resolution)
         self.assertTrue(np.alltrue(expected_array == phantom_image.array))
+
+    def test_image_creation_from_p16_full_value_range(self):
+        expected_array = np.array([[0, 255], [256, 65535]])
+        image_bytes = bytearray(b'\x00\x00\xff\x00\x00\x01\xff\xff')
+
+        phantom_image = PhantomImage.from_p16(image_bytes, (2, 2))
+        self.assertTrue(np.alltrue(expected_array == phantom_image.array))
+
+    def test_image_creation_from_p10_working(self):
+        expected_array = np.array([[1023, 0, 1, 512], [3, 1022, 100, 255]])
+        # Every group of 5 bytes contains 4 pixels with 10 bit each, the first pixel being the most significant bits
+        image_bytes = b''
+        for row in expected_array:
+            value = (int(row[0]) << 30) | (int(row[1]) << 20) | (int(row[2]) << 10) | int(row[3])
+            image_bytes += value.to_bytes(5, 'big')
+
+        phantom_image = PhantomImage.from_p10(image_bytes, (2, 4))
+        self.assertTrue(np.alltrue(expected_array == phantom_image.array))
+
+    def test_image_creation_from_transfer_format_p12l(self):
+        expected_array = np.array([[4095, 0], [1, 2048]])
+        # Every group of 3 bytes contains 2 pixels with 12 bit each
+        image_bytes = b'\xff\xf0\x00\x00\x18\x00'
+
+        phantom_image = PhantomImage.from_transfer_format('P12L', image_bytes, (2, 2))
+        self.assertTrue(np.alltrue(expected_array == phantom_image.array))
+
+    def test_image_conversion_to_p10_and_p12l_working(self):
+        image_array = np.array([[1023, 0, 1, 512], [3, 1022, 100, 255]])
+
+        phantom_image = PhantomImage(image_array)
+        self.assertEqual(b'\xff\xc0\x00\x06\x00\x00\xff\xe1\x90\xff', phantom_image.p10())
+        self.assertEqual(b'\x3f\xf0\x00\x00\x12\x00\x00\x33\xfe\x06\x40\xff', phantom_image.p12l())
+
+    def test_transfer_formats_decoded_into_narrow_dtype(self):
+        phantom_image = PhantomImage(np.array([[8, 7], [2, 4]]))
+        for fmt in ['P8', 'P10', 'P12L', 'P16']:
+            image_bytes = phantom_image.to_transfer_format(fmt)
+            decoded_image = PhantomImage.from_transfer_format(fmt, image_bytes, (2, 2))
+            self.assertEqual(PhantomImage.FORMAT_DTYPES[fmt], decoded_image.array.dtype)
+
+        decoded_image = PhantomImage.from_transfer_format('P8', phantom_image.p8(), (2, 2), dtype=np.float32)
+        self.assertEqual(np.float32, decoded_image.array.dtype)
+
+    def test_image_creation_into_output_array(self):
+        phantom_image = PhantomImage(np.array([[1023, 0, 1, 512], [3, 1022, 100, 255]]))
+        burst_array = np.zeros((3, 2, 4), dtype=np.uint16)
+        for fmt in ['P10', 'P12L', 'P16']:
+            image_bytes = phantom_image.to_transfer_format(fmt)
+            decoded_image = PhantomImage.from_transfer_format(fmt, image_bytes, (2, 4), out=burst_array[1])
+            self.assertTrue(np.alltrue(phantom_image.array == burst_array[1]))
+            self.assertTrue(np.shares_memory(decoded_image.array, burst_array))
+            burst_array[1] = 0
+
+        # The output array has to be able to hold the pixel values of the format
+        with self.assertRaises(ValueError):
+            PhantomImage.from_p10(phantom_image.p10(), (2, 4), out=np.zeros((2, 4), dtype=np.uint8))
+
+    def test_parallel_decoding_same_as_single_thread(self):
+        raw_bytes = np.random.randint(0, 256, 3 * 5 * 7, dtype=np.uint8).tobytes()
+        for fmt, resolution in [('P10', (12, 7)), ('P12L', (10, 7)), ('P8', (15, 7))]:
+            expected_image = PhantomImage.from_transfer_format(fmt, raw_bytes, resolution)
+            phantom_image = PhantomImage.from_transfer_format(fmt, raw_bytes, resolution, workers=4)
+            self.assertTrue(np.alltrue(expected_image.array == phantom_image.array))
+
+            out = np.zeros(resolution, dtype=np.uint16)
+            PhantomImage.from_transfer_format(fmt, raw_bytes, resolution, out=out, workers=3)
+            self.assertTrue(np.alltrue(expected_image.array == out))
+
+    def test_lazy_image_decoded_on_first_access(self):
+        expected_array = np.array([[1023, 0, 1, 512], [3, 1022, 100, 255]])
+        image_bytes = PhantomImage(expected_array).p10()
+
+        lazy_image = LazyPhantomImage('P10', image_bytes, (2, 4))
+        self.assertFalse(lazy_image.decoded)
+        # Requesting the same format the bytes are in must not decode the image
+        self.assertIs(image_bytes, lazy_image.to_transfer_format('P10'))
+        self.assertFalse(lazy_image.decoded)
+
+        self.assertTrue(np.alltrue(expected_array == lazy_image.array))
+        self.assertTrue(lazy_image.decoded)
+        self.assertIs(lazy_image.array, lazy_image.array)
+
+    def test_region_of_interest_decoding(self):
+        # The width of 10 is no multiple of the pixels per group, so the region starts at different positions within
+        # the groups for every row
+        phantom_image = PhantomImage(np.random.randint(0, 1024, (6, 10)))
+        roi = (3, 1, 5, 4)
+        expected_array = phantom_image.array[1:5, 3:8]
+        for fmt in ['P8', 'P10', 'P12L', 'P16']:
+            if fmt == 'P8':
+                image_bytes = PhantomImage(phantom_image.array % 256).p8()
+                expected = expected_array % 256
+            else:
+                image_bytes = phantom_image.to_transfer_format(fmt)
+                expected = expected_array
+            roi_image = PhantomImage.from_transfer_format(fmt, image_bytes, (6, 10), roi=roi)
+            self.assertEqual((4, 5), roi_image.array.shape)
+            self.assertTrue(np.alltrue(expected == roi_image.array))
+
+        with self.assertRaises(ValueError):
+            PhantomImage.from_transfer_format('P16', phantom_image.p16(), (6, 10), roi=(8, 0, 5, 1))
+
+    def test_binning_while_decoding(self):
+        image_array = np.random.randint(0, 4096, (9, 10))
+        image_bytes = PhantomImage(image_array).p12l()
+        blocks = image_array[0:8, 0:10].reshape(4, 2, 5, 2)
+
+        phantom_image = PhantomImage.from_transfer_format('P12L', image_bytes, (9, 10), binning=2, binning_mode='sum')
+        self.assertTrue(np.alltrue(blocks.sum(axis=(1, 3)) == phantom_image.array))
+
+        phantom_image = PhantomImage.from_transfer_format('P12L', image_bytes, (9, 10), binning=2, binning_mode='mean')
+        self.assertTrue(np.alltrue(blocks.sum(axis=(1, 3)) // 4 == phantom_image.array))
+        self.assertEqual(np.uint16, phantom_image.array.dtype)
+
+        phantom_image = PhantomImage.from_transfer_format(
+            'P12L', image_bytes, (9, 10), binning=3, binning_mode='decimate'
+        )
+        self.assertTrue(np.alltrue(image_array[0:9:3, 0:9:3] == phantom_image.array))
+
+    def test_burst_decoding_of_multiple_frames(self):
+        burst_array = np.random.randint(0, 1024, (3, 4, 6))
+        raw_bytes = b''.join(PhantomImage(frame).p10() for frame in burst_array)
+
+        phantom_burst = PhantomBurst.from_transfer_format('P10', raw_bytes, (4, 6))
+        self.assertEqual(3, len(phantom_burst))
+        self.assertEqual((3, 4, 6), phantom_burst.array.shape)
+        self.assertTrue(np.alltrue(burst_array == phantom_burst.array))
+        self.assertTrue(np.alltrue(burst_array[1] == phantom_burst[1].array))
+        self.assertEqual(2, len(phantom_burst[1:]))
+
+    def test_tone_mapping_with_lookup_table(self):
+        phantom_image = PhantomImage(np.array([[0, 1023], [2048, 4095]], dtype=np.uint16))
+
+        display_array = phantom_image.tone_mapped(bits=12)
+        self.assertEqual(np.uint8, display_array.dtype)
+        self.assertTrue(np.alltrue(np.array([[0, 64], [128, 255]]) == display_array))
+
+        # Everything below the window is black and everything above is white
+        display_array = phantom_image.tone_mapped(bits=12, window=2048, level=1024)
+        self.assertTrue(np.alltrue(np.array([[0, 127], [255, 255]]) == display_array))
+
+        # The tables are cached for the same settings
+        self.assertIs(PhantomImage.tone_map_table(12, 0, 4095, 1.0), PhantomImage.tone_map_table(12, 0, 4095, 1.0))
+
+    def test_statistics_from_raw_bytes(self):
+        image_array = np.random.randint(0, 1024, (70, 8))
+        image_array[3, 3] = 1023
+        lazy_image = LazyPhantomImage('P10', PhantomImage(image_array).p10(), (70, 8))
+
+        statistics = lazy_image.statistics()
+        self.assertFalse(lazy_image.decoded)
+        self.assertEqual(560, statistics['count'])
+        self.assertEqual(image_array.min(), statistics['min'])
+        self.assertEqual(image_array.max(), statistics['max'])
+        self.assertAlmostEqual(image_array.mean(), statistics['mean'])
+        self.assertEqual(np.sum(image_array == 1023), statistics['saturated'])
+        self.assertTrue(np.alltrue(np.bincount(image_array.reshape(-1), minlength=1024) == statistics['histogram']))
+
+        statistics = lazy_image.statistics(row_step=2)
+        self.assertEqual(image_array[::2].max(), statistics['max'])
+
+    def test_frame_generator_pool_and_moving_pattern(self):
+        frame_generator = PhantomFrameGenerator((4, 6), bits=10, pool_size=3, seed=1)
+        images = [frame_generator.grab() for _ in range(4)]
+        self.assertIs(images[0], images[3])
+        self.assertEqual(np.uint16, images[0].array.dtype)
+        self.assertTrue(images[0].array.max() <= 1023)
+        self.assertEqual(images[1].p10(), images[1].p10())
+        # The same seed has to produce the same images
+        self.assertTrue(np.all(PhantomFrameGenerator((4, 6), bits=10, pool_size=3, seed=1).array ==
+                               frame_generator.array))
+
+        frame_generator = PhantomFrameGenerator((2, 4), pool_size=2, pattern='gradient', speed=1)
+        first_image, second_image = next(frame_generator), next(frame_generator)
+        self.assertTrue(np.all(np.roll(first_image.array, 1, axis=1) == second_image.array))
+
+
+class TestPhantomMedia(TestCase):
+
+    def test_export_burst_to_png_files(self):
+        phantom_burst = PhantomBurst(np.random.randint(0, 4096, (5, 4, 6)).astype(np.uint16))
+        with tempfile.TemporaryDirectory() as folder:
+            result = PhantomMedia.export_images(phantom_burst, folder, workers=2, max_pending=2)
+            self.assertEqual(5, result['count'])
+            self.assertGreater(result['fps'], 0)
+
+            file_names = sorted(os.listdir(folder))
+            self.assertEqual(['frame_%06d.png' % index for index in range(5)], file_names)
+            array = imageio.imread(os.path.join(folder, file_names[3]))
+            self.assertTrue(np.alltrue(phantom_burst.array[3] == array))
+
+    def test_capture_file_images_accessed_by_index_and_slice(self):
+        burst_array = np.random.randint(0, 4096, (6, 4, 6))
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, 'capture.raw')
+            with open(path, mode='wb') as file:
+                for frame in burst_array:
+                    file.write(PhantomImage(frame).p12l())
+
+            capture_file = PhantomMedia.open_capture_file(path, (4, 6), 'P12L')
+            self.assertEqual(6, len(capture_file))
+            self.assertTrue(np.alltrue(burst_array[4] == capture_file[4].array))
+            self.assertTrue(np.alltrue(burst_array[-1] == capture_file[-1].array))
+            self.assertTrue(np.alltrue(burst_array[1:4] == capture_file[1:4].array))
+            self.assertTrue(np.alltrue(burst_array[::2] == capture_file[::2].array))
+            with self.assertRaises(IndexError):
+                capture_file[6]
+            del capture_file